@@ -65,14 +65,15 @@ class Truth(Bool):
     """
 
     _instances: dict[str, Truth] = dict()
+    _truth: str
 
     def __new__(cls, truth: str = 'TRUTH') -> Truth:
-        if truth not in cls._instances:
-            cls._instances[truth] = super(Bool, cls).__new__(cls, 1)
-        return cls._instances[truth]
-
-    def __init__(self, truth: str = 'TRUTH') -> None:
-        self._truth = truth
+        instance = cls._instances.get(truth)
+        if instance is None:
+            instance = super(Bool, cls).__new__(cls, 1)
+            instance._truth = truth
+            cls._instances[truth] = instance
+        return instance
 
     def __repr__(self) -> str:
         return f'Truth("{self._truth}")'
@@ -85,14 +86,15 @@ class Lie(Bool):
     """
 
     _instances: dict[str, Lie] = dict()
+    _lie: str
 
     def __new__(cls, lie: str = 'LIE') -> Lie:
-        if lie not in cls._instances:
-            cls._instances[lie] = super(Bool, cls).__new__(cls, 0)
-        return cls._instances[lie]
-
-    def __init__(self, lie: str = 'LIE') -> None:
-        self._lie = lie
+        instance = cls._instances.get(lie)
+        if instance is None:
+            instance = super(Bool, cls).__new__(cls, 0)
+            instance._lie = lie
+            cls._instances[lie] = instance
+        return instance
 
     def __repr__(self) -> str:
         return f'Lie("{self._lie}")'
@@ -47,7 +47,7 @@ def swap[U, V, R](f: Callable[[U, V], R]) -> Callable[[V, U], R]:
 
 def it[A](*args: A) -> Iterator[A]:
     """Function returning an iterator of its arguments."""
-    yield from args
+    return iter(args)
 
 
 def negate[**P](f: Callable[P, bool]) -> Callable[P, bool]:
@@ -64,7 +64,7 @@ class Lazy[D, R]:
         self._d: Final[D] = d
         self._pure: bool = pure
         self._evaluated: bool = False
-        self._exceptional: MB[bool] = MB()
+        self._exceptional: bool = False
         self._result: Xor[R, Exception]
 
     def __bool__(self) -> bool:
@@ -85,22 +85,26 @@ class Lazy[D, R]:
                 self._result, self._evaluated, self._exceptional = (
                     Xor(exc, RIGHT),
                     True,
-                    MB(True),
+                    True,
                 )
             else:
                 self._result, self._evaluated, self._exceptional = (
                     Xor(result, LEFT),
                     True,
-                    MB(False),
+                    False,
                 )
 
     def got_result(self) -> MB[bool]:
         """Return true if an evaluated Lazy did not raise an exception."""
-        return self._exceptional.bind(lambda x: MB(not x))
+        if self._evaluated:
+            return MB(not self._exceptional)
+        return MB()
 
     def got_exception(self) -> MB[bool]:
         """Return true if Lazy raised exception."""
-        return self._exceptional
+        if self._evaluated:
+            return MB(self._exceptional)
+        return MB()
 
     def get(self, alt: R | None = None) -> R | Never:
         """Get result only if evaluated and no exceptions occurred, otherwise
@@ -109,7 +113,7 @@ class Lazy[D, R]:
         A possible use case would be if the calculation is expensive, but if it
         has already been done, its result is better than the alternate value.
         """
-        if self._evaluated and self._result:
+        if self._evaluated and not self._exceptional:
             return self._result.get()
         if alt is not None:
             return alt
@@ -118,13 +122,13 @@ class Lazy[D, R]:
 
     def get_result(self) -> MB[R]:
         """Get result only if evaluated and not exceptional."""
-        if self._evaluated and self._result:
+        if self._evaluated and not self._exceptional:
             return self._result.get_left()
         return MB()
 
     def get_exception(self) -> MB[Exception]:
         """Get result only if evaluate and exceptional."""
-        if self._evaluated and not self._result:
+        if self._evaluated and self._exceptional:
             return self._result.get_right()
         return MB()
 
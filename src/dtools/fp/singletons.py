@@ -64,6 +64,7 @@ from collections.abc import Callable, Iterator
 from typing import Any, Final, final
 
 
+@final
 class NoValue:
     """Singleton class representing a missing value.
 
@@ -89,9 +90,6 @@ class NoValue:
             cls._instance = super(NoValue, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
-        return
-
     def __repr__(self) -> str:
         return 'NoValue()'
 
@@ -120,19 +118,20 @@ class Sentinel:
 
     """
 
-    __slots__ = ('_sentinel_name',)
+    __slots__ = ('_sentinel_repr',)
     _instances: dict[str, Sentinel] = {}
+    _sentinel_repr: str
 
     def __new__(cls, sentinel_name: str) -> Sentinel:
-        if sentinel_name not in cls._instances:
-            cls._instances[sentinel_name] = super(Sentinel, cls).__new__(cls)
-        return cls._instances[sentinel_name]
-
-    def __init__(self, sentinel_name: str) -> None:
-        self._sentinel_name = sentinel_name
+        instance = cls._instances.get(sentinel_name)
+        if instance is None:
+            instance = super(Sentinel, cls).__new__(cls)
+            instance._sentinel_repr = f"Sentinel('{sentinel_name}')"
+            cls._instances[sentinel_name] = instance
+        return instance
 
     def __repr__(self) -> str:
-        return "Sentinel('" + self._sentinel_name + "')"
+        return self._sentinel_repr
 
 
 @final
@@ -192,16 +191,16 @@ class Nada:
         return 0
 
     def __add__(self, right: Any) -> Nada:
-        return Nada()
+        return _nada
 
     def __radd__(self, left: Any) -> Nada:
-        return Nada()
+        return _nada
 
     def __mul__(self, right: Any) -> Nada:
-        return Nada()
+        return _nada
 
     def __rmul__(self, left: Any) -> Nada:
-        return Nada()
+        return _nada
 
     def __eq__(self, right: Any) -> bool:
         return False
@@ -222,22 +221,25 @@ class Nada:
         return False
 
     def __getitem__(self, index: int | slice) -> Any:
-        return Nada()
+        return _nada
 
     def __setitem__(self, index: int | slice, item: Any) -> None:
         return
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
-        return Nada()
+        return _nada
 
     def __getattr__(self, name: str) -> Callable[..., Any]:
         def method(*args: tuple[Any], **kwargs: dict[str, Any]) -> Any:
-            return Nada()
+            return _nada
 
         return method
 
     def nada_get(self, alt: Any = SENTINEL) -> Any:
         """Get an alternate value, defaults to `Nada()`."""
-        if alt == Sentinel('Nada'):
-            return Nada()
+        if alt is Nada.SENTINEL:
+            return _nada
         return alt
+
+
+_nada: Final[Nada] = Nada()
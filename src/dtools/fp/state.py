@@ -38,8 +38,7 @@ from __future__ import annotations
 __all__ = ['State']
 
 from collections.abc import Callable
-from typing import TypeVar
-from dtools.circular_array import CA
+from typing import Any, Final, TypeVar
 
 S = TypeVar('S')    # Needed only for pdoc documentation generation.
 A = TypeVar('A')    # Otherwise, ignored by both MyPy and Python. Makes
@@ -56,22 +55,88 @@ class State[S, A]:
       - it wraps a transformation old_state -> (value, new_state)
       - the `run` method is this wrapped transformation
       - `bind` is just state propagating function composition
+    - `bind`, `map`, `map2` and `both` do not nest closures
+      - they append a step to a linked list of steps
+      - `run` applies the steps in a loop, one after another
+      - the list is flattened on the first `run` and reused after that
+    - `run` is trampolined
+      - a `bind` step hands the next state action back to the loop
+      - the loop runs it in place instead of calling its `run` method
+      - neither long chains nor recursive binds grow the Python stack
 
     """
 
-    __slots__ = ('run',)
+    __slots__ = ('_run', '_steps', '_flat')
 
     def __init__(self, run: Callable[[S], tuple[A, S]]) -> None:
-        self.run = run
+        self._run: Callable[[S], tuple[Any, S]] = run
+        self._steps: tuple[Any, ...] = ()
+        self._flat: tuple[tuple[bool, Callable[..., Any]], ...] | None = None
+
+    def _then[B](self, binds: bool, step: Callable[..., Any]) -> State[S, B]:
+        state: State[S, B] = State(self._run)
+        state._steps = (binds, step, self._steps)
+        return state
+
+    def _flat_steps(self) -> tuple[tuple[bool, Callable[..., Any]], ...]:
+        flat = self._flat
+        if flat is None:
+            steps: list[tuple[bool, Callable[..., Any]]] = []
+            node = self._steps
+            while node:
+                binds, step, node = node
+                steps.append((binds, step))
+            steps.reverse()
+            flat = self._flat = tuple(steps)
+        return flat
+
+    def run(self, s: S) -> tuple[A, S]:
+        """Run the state action with an initial state.
+
+        - returns a `(value, new_state)` tuple
+
+        """
+        node = self._steps
+        if not node:
+            return self._run(s)
+
+        a, s = self._run(s)
+        binds, step, rest = node
+        if rest:
+            steps = self._flat or self._flat_steps()
+        elif not binds:
+            a, s = step(a, s)
+            return a, s
+        else:
+            sa: State[S, Any] = step(a)
+            a, s = sa._run(s)
+            if not sa._steps:
+                return a, s
+            steps = sa._flat or sa._flat_steps()
+
+        ii = 0
+        stack: list[tuple[tuple[tuple[bool, Callable[..., Any]], ...], int]] = []
+        while True:
+            if ii < len(steps):
+                binds, step = steps[ii]
+                ii += 1
+                if not binds:
+                    a, s = step(a, s)
+                    continue
+                sa = step(a)
+                a, s = sa._run(s)
+                if sa._steps:
+                    if ii < len(steps):
+                        stack.append((steps, ii))
+                    steps, ii = sa._flat or sa._flat_steps(), 0
+            elif stack:
+                steps, ii = stack.pop()
+            else:
+                return a, s
 
     def bind[B](self, g: Callable[[A], State[S, B]]) -> State[S, B]:
         """Perform function composition while propagating state."""
-
-        def compose(s: S) -> tuple[B, S]:
-            a, s = self.run(s)
-            return g(a).run(s)
-
-        return State(compose)
+        return self._then(True, g)
 
     def eval(self, init: S) -> A:
         """Evaluate the Monad via passing an initial state."""
@@ -80,15 +145,29 @@ class State[S, A]:
 
     def map[B](self, f: Callable[[A], B]) -> State[S, B]:
         """Map a function over a run action."""
-        return self.bind(lambda a: State.unit(f(a)))
+
+        def step(a: A, s: S) -> tuple[B, S]:
+            return f(a), s
+
+        return self._then(False, step)
 
     def map2[B, C](self, sb: State[S, B], f: Callable[[A, B], C]) -> State[S, C]:
         """Map a function of two variables over two state actions."""
-        return self.bind(lambda a: sb.map(lambda b: f(a, b)))
+
+        def step(a: A, s: S) -> tuple[C, S]:
+            b, s = sb.run(s)
+            return f(a, b), s
+
+        return self._then(False, step)
 
     def both[B](self, rb: State[S, B]) -> State[S, tuple[A, B]]:
         """Return a tuple of two state actions."""
-        return self.map2(rb, lambda a, b: (a, b))
+
+        def step(a: A, s: S) -> tuple[tuple[A, B], S]:
+            b, s = rb.run(s)
+            return (a, b), s
+
+        return self._then(False, step)
 
     @staticmethod
     def unit[ST, B](b: B) -> State[ST, B]:
@@ -102,9 +181,10 @@ class State[S, A]:
         - the current state is propagated unchanged
         - current value now set to current state
         - will need type annotation
+        - the same immutable state action is returned on every call
 
         """
-        return State[ST, ST](lambda s: (s, s))
+        return _get
 
     @staticmethod
     def put[ST](s: ST) -> State[ST, tuple[()]]:
@@ -126,7 +206,7 @@ class State[S, A]:
           - mypy has no "a priori" way to know what ST is
 
         """
-        return State.get().bind(lambda a: State.put(f(a)))  # type: ignore
+        return State(lambda s: ((), f(s)))
 
     @staticmethod
     def sequence[ST, AA](sas: list[State[ST, AA]]) -> State[ST, list[AA]]:
@@ -134,14 +214,19 @@ class State[S, A]:
 
         - all state actions must be of the same type
         - run method evaluates list front to back
+          - in a single loop, each run building a new list
 
         """
+        actions = tuple(sas)
+
+        def run(s: ST) -> tuple[list[AA], ST]:
+            values: list[AA] = []
+            for sa in actions:
+                a, s = sa.run(s)
+                values.append(a)
+            return values, s
+
+        return State(run)
 
-        def append_ret(ls: list[AA], a: AA) -> list[AA]:
-            ls.append(a)
-            return ls
 
-        return CA(sas).foldl(
-            lambda s1, sa: s1.map2(sa, append_ret),
-            State.unit(list[AA]([]))
-        )
+_get: Final[State[Any, Any]] = State(lambda s: (s, s))
@@ -14,7 +14,6 @@
 
 from dtools.circular_array import ca, CA
 from dtools.fp.function import partial, sequenced, swap, it
-from dtools.iterables import mb_fold_left, take
 
 class Test_function:
     def test_same_type(self) -> None:
@@ -35,9 +34,7 @@ class Test_function:
 
     def test_different_types(self) -> None:
         def names(num: int, sep: str, names: list[str]) -> str:
-            return mb_fold_left(take(names, num),
-                         lambda names, name: names + sep + name,
-                         "").get()[len(sep):]
+            return sep.join(names[:num])
 
         charactors = ['Moe', 'Larry', 'Curlie', 'Shemp', 'Curlie Joe']
         stooges = names(3, ', ', charactors)
@@ -0,0 +1,38 @@
+# Copyright 2023-2025 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from typing import Final
+from dtools.fp.singletons import Sentinel
+
+_sentinel: Final[Sentinel] = Sentinel('test_sentinel')
+
+
+class Test_identity:
+    def test_same_name(self) -> None:
+        assert Sentinel('test_sentinel') is _sentinel
+        assert Sentinel('test_sentinel') == _sentinel
+
+    def test_different_names(self) -> None:
+        other = Sentinel('other_sentinel')
+        assert other is not _sentinel
+        assert other != _sentinel
+        assert other is Sentinel('other_sentinel')
+
+
+class Test_str:
+    def test_sentinel_repr(self) -> None:
+        assert repr(_sentinel) == "Sentinel('test_sentinel')"
+        assert repr(Sentinel('test_sentinel')) == "Sentinel('test_sentinel')"
@@ -53,6 +53,41 @@ class Test_simple:
         assert (s1, a1) == (6, 6)
         assert (s2, a2) == (7, 7)
 
+    def test_long_chains(self) -> None:
+        count: State[int, int] = State(lambda s: (s, s+1))
+
+        chain = count
+        for _ in range(10000):
+            chain = chain.bind(lambda a: count)
+        assert chain.run(0) == (10000, 10001)
+
+        chain = count
+        for _ in range(10000):
+            chain = chain.map(lambda a: a + 2)
+        assert chain.run(5) == (20005, 6)
+
+        sal = State.sequence([count]*5000)
+        ll, ss = sal.run(0)
+        assert ss == 5000
+        assert ll == list(range(5000))
+
+    def test_recursive_binds(self) -> None:
+        count: State[int, int] = State(lambda s: (s, s+1))
+
+        def loop(n: int) -> State[int, int]:
+            if n == 0:
+                return count
+            return count.bind(lambda _: loop(n-1))
+
+        assert loop(10000).run(0) == (10000, 10001)
+
+        def depth(n: int) -> State[int, int]:
+            if n == 0:
+                return State.unit(0)
+            return count.bind(lambda _: depth(n-1)).map(lambda a: a + 1)
+
+        assert depth(10000).run(0) == (10000, 10000)
+
     def test_mod3_count(self) -> None:
         m3: State[int, int] = State(lambda s: ((s+1)%3, s))
 
@@ -155,3 +190,6 @@ class Test_simple:
         ll, ss = sal.run(0)
         assert ss == 0
         assert ll == ["1", "2", "3", "4"]
+        ll, ss = sal.run(0)
+        assert ss == 0
+        assert ll == ["1", "2", "3", "4"]